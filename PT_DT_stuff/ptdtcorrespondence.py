@@ -1,29 +1,65 @@
+from array import array
 from sage.structure.sage_object import SageObject
-from hillman_grassl import Hillman_Grassl, Inverse_HG
+from sage.structure.unique_representation import CachedRepresentation
+from ptdt_package.hillman_grassl import Hillman_Grassl, Inverse_HG
 def reverse_hook(shape, i, j):
     conj = shape.conjugate()
     vertical = shape
 
-class PTDTCorrespondence(SageObject):
+class PTDTCorrespondence(CachedRepresentation, SageObject):
+    """
+    The matching of cells which splits a skew plane partition with
+    inner shape ``shape`` into a reverse plane partition of that shape
+    (PT) and a plane partition (DT_0), on the Hillman-Grassl side.
+
+    Instances are cached per shape.  Cells are numbered by flattened
+    positions, and the maps are stored as arrays of those numbers:
+
+    - a cell ``(i, j)`` of the shape is numbered in row-major order;
+
+    - a DT cell ``(i, j)`` is numbered ``i * dt_width + j``, in the
+      window of ``dt_height`` rows and ``dt_width`` columns;
+
+    - a DT_0 cell ``(p, q)`` is numbered ``p * dt0_width + q``, in the
+      window of ``dt0_height`` rows and ``dt0_width`` columns.
+
+    Outside of the windows, DT cells map to DT_0 cells by shifting.
+
+    EXAMPLES::
+
+        sage: from ptdt_package import *
+        sage: load("PT_DT_stuff/ptdtcorrespondence.py")
+        sage: PTDTCorrespondence([2, 1]) is PTDTCorrespondence((2, 1))
+        True
+    """
+    @staticmethod
+    def __classcall__(cls, shape):
+        return super(PTDTCorrespondence, cls).__classcall__(
+            cls, Partition(shape))
+
     def __init__(self, shape):
-        shape = Partition(shape)
-        
-        self._dt2pt = dict()
-        self._pt2dt = dict()
         self._shape = shape
+        self._conj = shape.conjugate()
+        # row-major numbering of the cells of the shape
+        self._pt_cells = list(shape.cells())
+        self._pt_offsets = [sum(shape[:i]) for i in range(len(shape))]
+        self._pt_hooks = array('l', [shape.hook_length(i, j)
+                                     for i, j in self._pt_cells])
 
         if not shape:
             # empty partition, do nothing
+            self._dt_height = self._dt_width = 0
+            self._dt0_height = self._dt0_width = 0
             return
-        
+
         max_length = shape.hook_length(0, 0)
 
-        # Calculate the shape of the tail, possibly useless
+        # Calculate the shape of the tail
         outer1 = Partition(shape[i] + max_length - i
-                          for i in range(len(shape)))
-        conj = shape.conjugate()
+                           for i in range(len(shape)))
+        conj = self._conj
         outer2 = Partition(conj[i] + max_length - i
-                          for i in range(len(conj))).conjugate()
+                           for i in range(len(conj))).conjugate()
         outer = Partition(outer1[i] if i < len(shape) else outer2[i]
                           for i in range(len(outer2)))
         tail = SkewPartition([outer, shape])
@@ -31,53 +67,101 @@ class PTDTCorrespondence(SageObject):
 
         cells_by_hook = [[] for _ in range(max_length)]
         for i, j in tail.cells():
-            vert = conj[j] if j < len(conj) else 0
-            horiz = shape[i] if i < len(shape) else 0
-            hook = i - horiz + j - vert + 1
-            cells_by_hook[hook - 1].append((i, j))
+            cells_by_hook[self._dt_hook(i, j) - 1].append((i, j))
 
         # match the inside of the shape (pt_l) to the tail (dt_l)
+        matches = {}
         for i, j in shape.cells():
             hook = shape.hook_length(i, j)
-            match = cells_by_hook[hook - 1][-1]
-            del cells_by_hook[hook - 1][-1]
-            self._dt2pt[match] = i, j, True
-            self._pt2dt[i, j, True] = match
+            matches[cells_by_hook[hook - 1].pop()] = i, j, True
 
-        # match the remaining 
+        # match the remaining
         for hook in range(max_length):
-            num_matched = 0
-            for i, j in cells_by_hook[hook]:
-                p, q = hook - num_matched, num_matched
-                self._dt2pt[i, j] = p, q, False
-                self._pt2dt[p, q, False] = i, j
-                num_matched += 1
-            assert num_matched == hook + 1
+            for num_matched, (i, j) in enumerate(cells_by_hook[hook]):
+                matches[i, j] = hook - num_matched, num_matched, False
+            assert len(cells_by_hook[hook]) == hook + 1
+
+        # The DT_0 window holds the tail, and the DT window everything
+        # which can be shifted into the DT_0 window
+        H0, W0 = len(outer), outer[0]
+        H, W = H0 + len(shape), W0 + shape[0]
+        self._dt0_height, self._dt0_width = H0, W0
+        self._dt_height, self._dt_width = H, W
+
+        self._dt_pt = array('l', [-1] * (H * W))
+        self._dt_row = array('l', [-1] * (H * W))
+        self._dt_col = array('l', [-1] * (H * W))
+        self._pt_dt = array('l', [-1] * len(self._pt_cells))
+        self._dt0_dt = array('l', [-1] * (H0 * W0))
+        for i in range(H):
+            for j in range(W):
+                if i < len(shape) and j < shape[i]:
+                    continue
+                k = i * W + j
+                if (i, j) in matches:
+                    x, y, use_pt = matches[i, j]
+                else:
+                    x, y = self._dt_shift(i, j)
+                    use_pt = False
+                if use_pt:
+                    t = self._pt_offsets[x] + y
+                    self._dt_pt[k] = t
+                    self._pt_dt[t] = k
+                else:
+                    self._dt_row[k], self._dt_col[k] = x, y
+                    if x < H0 and y < W0:
+                        assert self._dt0_dt[x * W0 + y] == -1
+                        self._dt0_dt[x * W0 + y] = k
 
         # Check everything worked as expected
-        assert all((i, j) in self._dt2pt for i, j in tail.cells())
-        assert all((i - j, j, False) in self._pt2dt
-                   for i in range(0, max_length)
-                   for j in range(i + 1))
-        assert all((i, j, True) in self._pt2dt
-                   for i, j in shape.cells())
-        assert all(self._pt2dt[self._dt2pt[k]] == k
-                   for k in self._dt2pt)
-        assert all(self._dt2pt[self._pt2dt[k]] == k
-                   for k in self._pt2dt)
+        assert all(k >= 0 for k in self._pt_dt)
+        assert all(k >= 0 for k in self._dt0_dt)
 
-    def dt2pt(self, dt_l):
-        # Check our input is good
-        dt_l = SkewTableau(dt_l)
-        if dt_l.shape().inner() != self._shape:
-            raise ValueError("DT has incorrect inner shape")
+    def _dt_shift(self, i, j):
+        """
+        Return the DT_0 cell of a DT cell ``(i, j)`` outside of the tail.
+        """
+        shape = self._shape
+        if i >= len(shape) and j >= shape[0]:
+            # the big infinite box
+            return i, j
+        elif i >= len(shape):
+            # left strip
+            return i - self._conj[j], j
+        else:
+            # top strip
+            return i, j - shape[i]
 
-        # If the shape is empty, DT_0 = DT_l
-        if not self._shape:
-            return Tableau([]), dt_l
-        
+    def _dt_hook(self, i, j):
+        """
+        Return the hook length of a DT cell ``(i, j)``, whose arm and
+        leg stop at the shape.
+        """
+        shape, conj = self._shape, self._conj
+        horiz = shape[i] if i < len(shape) else 0
+        vert = conj[j] if j < len(conj) else 0
+        return i - horiz + j - vert + 1
+
+    def _dt_target(self, i, j):
+        """
+        Return ``(t, x, y)`` for a DT cell ``(i, j)``, where ``t`` is
+        the PT cell it maps to, or -1 if it maps to the DT_0 cell
+        ``(x, y)``.
+        """
+        if i < self._dt_height and j < self._dt_width:
+            k = i * self._dt_width + j
+            return self._dt_pt[k], self._dt_row[k], self._dt_col[k]
+        x, y = self._dt_shift(i, j)
+        return -1, x, y
+
+    def _dt_hg_cells(self, dt_l):
+        """
+        Return the height and width of the DT side, and the nonzero
+        entries of the Hillman-Grassl tableau of ``dt_l`` as triples
+        ``(i, j, value)`` in near corner coordinates.
+        """
         # fill dt_l with zeros and flip it
-        max_len = max(len(r) for r in dt_l)
+        max_len = max([len(r) for r in dt_l] + [0])
         new_rows = [[0] * (max_len - len(r)) +
                     [x for x in reversed(r) if x is not None]
                     for r in reversed(dt_l)]
@@ -85,47 +169,330 @@ class PTDTCorrespondence(SageObject):
         # convert to hillman-grassl
         dt_l_hg = Hillman_Grassl(new_rows)
 
-        # create new hillman-grassl's
-        width = len(dt_l_hg[0])
+        # the rows of dt_l_hg get shorter where they meet the shape, so
+        # the width is the longest row
+        width = max_len
         height = len(dt_l_hg)
-        pt_l_hg = [[0] * l for l in self._shape]
-        dt_0_hg = [[0] * width for i in range(height)]
 
-        # fill in pt and dt_0.  This is the messy part
-        for r in range(len(dt_l_hg)):
-            for c in range(len(dt_l_hg[r])):
-                value = dt_l_hg[r][c]
-                if value == 0:
-                    continue
-                # r and c count from far corner, but our board drawings
-                # count from the near corner
-                i = height - r - 1
-                j = width - c - 1
-                if i >= len(self._shape) and j >= self._shape[0]:
-                    # we're in the big infinite box
-                    dt_0_hg[r][c] = value
-                elif (i, j) in self._dt2pt:
-                    # we're in the tail
-                    x, y, use_pt = self._dt2pt[i, j]
-                    if use_pt:
-                        pt_l_hg[x][y] = value
-                    else:
-                        dt_0_hg[height - x - 1][width - y - 1] = value
-                elif i >= len(self.shape):
-                    # left strip
-                    offset = self._shape.conjugate()[j]
-                    dt_0_hg[r + offset][c] = value
-                else:
-                    # top strip
-                    offset = self._shape[i]
-                    dt_0_hg[r][c + offset] = value
+        # r and c count from far corner, but our board drawings count
+        # from the near corner
+        cells = [(height - r - 1, width - c - 1, dt_l_hg[r][c])
+                 for r in range(height)
+                 for c in range(len(dt_l_hg[r]))
+                 if dt_l_hg[r][c] != 0]
+        return height, width, cells
 
-        # convert back using inverse hg
-        dt_0_wrpp = Inverse_HG(dt_0_hg)
-        pt_l = Inverse_HG(pt_l_hg)
+    def _dt_0_hg_cells(self, dt_0):
+        """
+        Return the nonzero entries of the Hillman-Grassl tableau of the
+        plane partition ``dt_0``, as triples ``(p, q, value)`` in near
+        corner coordinates.
+        """
+        # flip dt_0 so it is a reverse plane partition, r and c count
+        # from the far corner
+        dt_0 = [[x for x in r if x is not None] for r in dt_0]
+        rows = len(dt_0)
+        cols = max([len(r) for r in dt_0] + [0])
+        flipped = [[0] * (cols - len(r)) + list(reversed(r))
+                   for r in reversed(dt_0)]
+        dt_0_hg = Hillman_Grassl(flipped)
+        return [(rows - r - 1, cols - c - 1, dt_0_hg[r][c])
+                for r in range(rows)
+                for c in range(cols)
+                if dt_0_hg[r][c] != 0]
+
+    def _split_hg(self, dt_l, pt_l_hg, dt_0_cells):
+        """
+        Split the Hillman-Grassl tableau of ``dt_l`` into the PT and
+        DT_0 sides.
+
+        The entries for PT are written into ``pt_l_hg``, which must be
+        all zero, and those for DT_0 are appended to ``dt_0_cells`` as
+        triples ``(x, y, value)`` in near corner coordinates.  Returns
+        the height and width of the DT side, and the sizes of the PT
+        and DT_0 sides.
+        """
+        height, width, cells = self._dt_hg_cells(dt_l)
+        pt_size = dt_0_size = 0
+        for i, j, value in cells:
+            t, x, y = self._dt_target(i, j)
+            if t >= 0:
+                x, y = self._pt_cells[t]
+                pt_l_hg[x][y] = value
+                pt_size += self._pt_hooks[t] * value
+            else:
+                dt_0_cells.append((x, y, value))
+                dt_0_size += (x + y + 1) * value
+        return height, width, pt_size, dt_0_size
+
+    def _dt_0(self, dt_0_cells, height, width):
+        """
+        Return the plane partition DT_0 with the given Hillman-Grassl
+        entries, in a grid of at least ``height`` by ``width``.
+        """
+        rows = max([height] + [x + 1 for x, y, v in dt_0_cells])
+        cols = max([width] + [y + 1 for x, y, v in dt_0_cells])
+        dt_0_hg = [[0] * cols for i in range(rows)]
+        for x, y, value in dt_0_cells:
+            dt_0_hg[rows - x - 1][cols - y - 1] = value
 
-        # flip dt_0 around so it is a normal plane partition
+        # convert back using inverse hg, and flip dt_0 around so it is
+        # a normal plane partition
+        dt_0_wrpp = Inverse_HG(dt_0_hg)
         dt_rows = [[x for x in reversed(r) if x != 0]
                    for r in reversed(dt_0_wrpp)]
-        dt_0 = Tableau(r for r in dt_rows if r)
-        return pt_l, dt_0
+        return Tableau(r for r in dt_rows if r)
+
+    def dt2pt(self, dt_l):
+        """
+        Split the skew plane partition ``dt_l`` into a reverse plane
+        partition of the shape and a plane partition.
+
+        EXAMPLES:
+
+        The width of the DT side is that of its longest row, even when
+        the last row is inside the shape::
+
+            sage: from ptdt_package import *
+            sage: load("PT_DT_stuff/ptdtcorrespondence.py")
+            sage: PTDTCorrespondence([1]).dt2pt([[None, 1]])
+            ([[0]], [[1]])
+            sage: PTDTCorrespondence([2, 1]).dt2pt([[None, None, 2, 1], [None, 1]])
+            ([[0, 0], [1]], [[2], [1]])
+            sage: PTDTCorrespondence([2, 1]).dt2pt([[None, None, 1], [None], [1]])
+            ([[0, 1], [0]], [[1]])
+        """
+        # Check our input is good
+        dt_l = SkewTableau(dt_l)
+        if dt_l.shape().inner() != self._shape:
+            raise ValueError("DT has incorrect inner shape")
+
+        # If the shape is empty, DT_0 = DT_l
+        if not self._shape:
+            return Tableau([]), dt_l
+
+        pt_l_hg = [[0] * l for l in self._shape]
+        dt_0_cells = []
+        height, width, _, _ = self._split_hg(dt_l, pt_l_hg, dt_0_cells)
+        return Inverse_HG(pt_l_hg), self._dt_0(dt_0_cells, height, width)
+
+    def dt2pt_iter(self, dt_ls, sizes_only=False):
+        """
+        Apply :meth:`dt2pt` to every skew plane partition in ``dt_ls``,
+        such as a graded component ``SkewPlanePartitions(shape, n)``.
+
+        Yields the pairs ``(pt_l, dt_0)``, or only the pairs of their
+        sizes if ``sizes_only`` is True.  The sizes are read off the
+        Hillman-Grassl side, so neither inverse is computed in that
+        mode.  The inputs are not checked, and the buffers for the
+        Hillman-Grassl tableaux are reused between elements.
+
+        EXAMPLES::
+
+            sage: from ptdt_package import *
+            sage: load("PT_DT_stuff/ptdtcorrespondence.py")
+            sage: from collections import Counter
+            sage: corr = PTDTCorrespondence([2, 1])
+            sage: DT = SkewPlanePartitions([2, 1], 4)
+            sage: sorted(Counter(corr.dt2pt_iter(DT, sizes_only=True)).items())
+            [((0, 4), 13), ((1, 3), 12), ((2, 2), 9), ((3, 1), 5), ((4, 0), 7)]
+            sage: list(corr.dt2pt_iter(DT)) == [corr.dt2pt(x) for x in DT]
+            True
+        """
+        if not self._shape:
+            for dt_l in dt_ls:
+                if sizes_only:
+                    yield 0, sum(x for r in dt_l for x in r if x is not None)
+                else:
+                    yield Tableau([]), dt_l
+            return
+
+        pt_l_hg = [[0] * l for l in self._shape]
+        dt_0_cells = []
+        for dt_l in dt_ls:
+            height, width, pt_size, dt_0_size = self._split_hg(
+                dt_l, pt_l_hg, dt_0_cells)
+            if sizes_only:
+                yield pt_size, dt_0_size
+            else:
+                yield (Inverse_HG(pt_l_hg),
+                       self._dt_0(dt_0_cells, height, width))
+            # reset the buffers
+            for row in pt_l_hg:
+                for c in range(len(row)):
+                    row[c] = 0
+            del dt_0_cells[:]
+
+    def _dt_unshift(self, p, q):
+        """
+        Return the DT cell of a DT_0 cell ``(p, q)`` outside of the
+        DT_0 window, inverting :meth:`_dt_shift`.
+        """
+        shape = self._shape
+        if p >= len(shape) and q >= shape[0]:
+            # the big infinite box
+            return p, q
+        elif q < shape[0]:
+            # left strip
+            return p + self._conj[q], q
+        else:
+            # top strip
+            return p, q + shape[p]
+
+    def pt2dt(self, pt_l, dt_0):
+        """
+        Return the skew plane partition which :meth:`dt2pt` sends to
+        the pair ``(pt_l, dt_0)``.
+
+        The Hillman-Grassl tableaux of ``pt_l`` and ``dt_0`` are merged
+        into the Hillman-Grassl tableau of the DT side using the cell
+        tables, and then inverted.
+
+        EXAMPLES::
+
+            sage: from ptdt_package import *
+            sage: load("PT_DT_stuff/ptdtcorrespondence.py")
+            sage: corr = PTDTCorrespondence([2, 1])
+            sage: corr.pt2dt([[0, 1], [1]], [[1]])
+            [[None, None, 1], [None, 1], [1]]
+            sage: all(corr.pt2dt(*corr.dt2pt(x)) == x
+            ....:     for x in SkewPlanePartitions([2, 1], 4))
+            True
+        """
+        shape = self._shape
+        if [len(r) for r in pt_l] != list(shape):
+            raise ValueError("PT has incorrect shape")
+
+        # If the shape is empty, DT_l = DT_0
+        if not shape:
+            return SkewPlanePartition(dt_0)
+
+        W, W0 = self._dt_width, self._dt0_width
+        dt_cells = []
+        pt_l_hg = Hillman_Grassl(pt_l)
+        for t, (x, y) in enumerate(self._pt_cells):
+            value = pt_l_hg[x][y]
+            if value != 0:
+                i, j = divmod(self._pt_dt[t], W)
+                dt_cells.append((i, j, value))
+
+        for p, q, value in self._dt_0_hg_cells(dt_0):
+            if p < self._dt0_height and q < W0:
+                i, j = divmod(self._dt0_dt[p * W0 + q], W)
+            else:
+                i, j = self._dt_unshift(p, q)
+            dt_cells.append((i, j, value))
+
+        # the DT side in far corner coordinates, the rows get shorter
+        # where they meet the shape
+        height = max([len(shape)] + [i + 1 for i, j, v in dt_cells])
+        width = max([shape[0]] + [j + 1 for i, j, v in dt_cells])
+        inner = [shape[i] if i < len(shape) else 0 for i in range(height)]
+        dt_l_hg = [[0] * (width - inner[height - r - 1])
+                   for r in range(height)]
+        for i, j, value in dt_cells:
+            dt_l_hg[height - i - 1][width - j - 1] = value
+
+        # convert back using inverse hg, and flip it around
+        dt_l_wrpp = Inverse_HG(dt_l_hg)
+        return SkewPlanePartition([[None] * inner[i] +
+                                   list(reversed(dt_l_wrpp[height - i - 1]))
+                                   for i in range(height)])
+
+    def dt_component(self, n):
+        """
+        Iterate over the skew plane partitions of size ``n``, with
+        inner shape ``shape``, by applying :meth:`pt2dt` to the pairs
+        of a reverse plane partition and a plane partition whose sizes
+        add to ``n``.
+
+        EXAMPLES::
+
+            sage: from ptdt_package import *
+            sage: load("PT_DT_stuff/ptdtcorrespondence.py")
+            sage: DT = SkewPlanePartitions([2, 1], 4)
+            sage: L = list(PTDTCorrespondence([2, 1]).dt_component(4))
+            sage: len(L) == DT.cardinality() and all(x in DT for x in L)
+            True
+        """
+        for k in range(n + 1):
+            for pt_l in ReversePlanePartitions(self._shape, k):
+                for dt_0 in SkewPlanePartitions([], n - k):
+                    yield self.pt2dt(pt_l, dt_0)
+
+    def check_component(self, n):
+        """
+        Check the correspondence on the skew plane partitions of size
+        ``n``, one at a time.
+
+        Each DT is sent to ``(pt_l, dt_0)`` and checked for sizes adding
+        up, for the hook lengths of the Hillman-Grassl tableaux agreeing
+        (which refines the weight ``q^size``), and for :meth:`pt2dt`
+        giving it back.  Finally the number of DTs is compared with the
+        number of pairs.  Only counters are kept between elements.
+
+        Returns None, or the first counterexample as a tuple
+        ``(dt_l, pt_l, dt_0, reason)``.
+
+        EXAMPLES::
+
+            sage: from ptdt_package import *
+            sage: load("PT_DT_stuff/ptdtcorrespondence.py")
+            sage: PTDTCorrespondence([3, 1]).check_component(4) is None
+            True
+        """
+        count = 0
+        for dt_l in SkewPlanePartitions(self._shape, n):
+            count += 1
+            pt_l, dt_0 = self.dt2pt(dt_l)
+            pt_size = sum(x for r in pt_l for x in r)
+            dt_0_size = sum(x for r in dt_0 for x in r)
+            if pt_size + dt_0_size != n:
+                return dt_l, pt_l, dt_0, "sizes do not add up"
+
+            # the hook lengths of DT, with those of PT and DT_0 removed
+            hooks = {}
+            for i, j, value in self._dt_hg_cells(dt_l)[2]:
+                h = self._dt_hook(i, j)
+                hooks[h] = hooks.get(h, 0) + value
+            if self._shape:
+                pt_l_hg = Hillman_Grassl(pt_l)
+                for t, (x, y) in enumerate(self._pt_cells):
+                    h = self._pt_hooks[t]
+                    hooks[h] = hooks.get(h, 0) - pt_l_hg[x][y]
+            for p, q, value in self._dt_0_hg_cells(dt_0):
+                hooks[p + q + 1] = hooks.get(p + q + 1, 0) - value
+            if any(hooks.values()):
+                return dt_l, pt_l, dt_0, "weights do not agree"
+
+            if self.pt2dt(pt_l, dt_0) != dt_l:
+                return dt_l, pt_l, dt_0, "pt2dt does not invert dt2pt"
+
+        pairs = sum(ReversePlanePartitions(self._shape, k).cardinality() *
+                    SkewPlanePartitions([], n - k).cardinality()
+                    for k in range(n + 1))
+        if count != pairs:
+            return None, None, None, "%d DTs but %d pairs" % (count, pairs)
+        return None
+
+def check_ptdt_bijection(shape, prec=6):
+    """
+    Check that the correspondence is a bijection from DT to DT_0 x PT
+    in each size below prec, printing the first counterexample.
+
+    EXAMPLES::
+
+        sage: from ptdt_package import *
+        sage: load("PT_DT_stuff/ptdtcorrespondence.py")
+        sage: check_ptdt_bijection([2, 1], 5)
+        True
+    """
+    corr = PTDTCorrespondence(shape)
+    for n in range(prec):
+        bad = corr.check_component(n)
+        if bad is not None:
+            dt_l, pt_l, dt_0, reason = bad
+            print "Size {}: {}".format(n, reason)
+            print "DT = {}, PT = {}, DT_0 = {}".format(dt_l, pt_l, dt_0)
+            return False
+    return True
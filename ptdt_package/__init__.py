@@ -5,4 +5,6 @@ from .reverse_plane_partition import (ReversePlanePartition,
 from .hillman_grassl_tableau import (HillmanGrasslTableau,
                                      HillmanGrasslTableaux)
 
-from .weights import weighted_sum
+from .rsk import (matrix_to_plane_partition, plane_partition_to_matrix,
+                  random_plane_partition)
+from .weights import weighted_sum, eulerian_polynomial, pt_box_series
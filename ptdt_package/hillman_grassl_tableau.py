@@ -6,12 +6,67 @@ from sage.combinat.integer_vector_weighted import WeightedIntegerVectors
 from sage.sets.family import Family
 from sage.sets.disjoint_union_enumerated_sets import \
     DisjointUnionEnumeratedSets
-from sage.rings.all import NN
+from sage.rings.all import NN, Integer
 from sage.categories.infinite_enumerated_sets import \
     InfiniteEnumeratedSets
 from sage.categories.finite_enumerated_sets import FiniteEnumeratedSets
 from sage.categories.sets_with_grading import SetsWithGrading
 from sage.structure.parent import Parent
+from sage.misc.prandom import random
+from sage.misc.cachefunc import cached_method
+from math import floor, log
+
+def _boltzmann_parameter(hooks, size):
+    """
+    Return q such that the expected size of a Boltzmann sample,
+    sum h q^h / (1 - q^h) over the hooks h, is ``size``.
+    """
+    expected = lambda q: sum(h * q ** h / (1 - q ** h) for h in hooks)
+    lo, hi = 0.0, 1.0
+    for _ in range(60):
+        q = (lo + hi) / 2
+        if expected(q) < size:
+            lo = q
+        else:
+            hi = q
+    return (lo + hi) / 2
+
+def _boltzmann_vector(hooks, size, q=None):
+    """
+    Return a uniformly random vector x of non-negative integers with
+    sum x_k hooks[k] equal to ``size``.
+
+    Each x_k is drawn independently, geometric with parameter
+    q^hooks[k], so that every vector of the same size is equally
+    likely, and samples of the wrong size are rejected.  If q is not
+    given, it is chosen so that the expected size is ``size``.  Even
+    then a sample has exactly the right size with probability about
+    one over the standard deviation of the size, so the expected
+    number of attempts grows with ``size``, and each attempt draws
+    up to one entry per hook.  The hooks must include 1 if size > 0.
+    """
+    if size == 0:
+        return [Integer(0)] * len(hooks)
+    if 1 not in hooks:
+        raise ValueError("there are no vectors of size %s" % size)
+    if q is None:
+        q = _boltzmann_parameter(hooks, size)
+    elif not 0 < q < 1:
+        raise ValueError("q must be in (0, 1)")
+    logs = [h * log(q) for h in hooks]
+    while True:
+        vec = []
+        total = 0
+        for h, l in zip(hooks, logs):
+            # Inverse transform sampling, 1 - random() is in (0, 1]
+            x = int(floor(log(1 - random()) / l))
+            total += x * h
+            if total > size:
+                break
+            vec.append(Integer(x))
+        else:
+            if total == size:
+                return vec
 
 class HillmanGrasslTableau(Tableau):
     r"""
@@ -201,10 +256,104 @@ class HillmanGrasslTableaux_size(HillmanGrasslTableaux):
     def cardinality(self):
         return self._weighted_integer_vectors().cardinality()
 
-    def random_element(self):
-        vec = self._weighted_integer_vectors().random_element()
+    @cached_method
+    def _rank_table(self):
+        """
+        Return the order of the cells used by ``__iter__``, and a table
+        of counts for ranking.
+
+        ``WeightedIntegerVectors`` lists vectors in reverse
+        lexicographic order, after sorting the hooks in decreasing
+        order, with equal hooks taken from the last cell first.
+        ``counts[k][r]`` is the number of ways to make ``r`` from the
+        cells ``order[k:]``.
+        """
+        hooks = sum(self._shape.hook_lengths(), [])
+        order = sorted(range(len(hooks)), key=lambda j: (-hooks[j], -j))
+        n = self._size
+        counts = [[Integer(0)] * (n + 1) for _ in range(len(hooks) + 1)]
+        counts[-1][0] = Integer(1)
+        for k in reversed(range(len(hooks))):
+            h = hooks[order[k]]
+            for r in range(n + 1):
+                counts[k][r] = counts[k + 1][r] + (counts[k][r - h]
+                                                   if r >= h else 0)
+        return hooks, order, counts
+
+    def rank(self, x):
+        """
+        Return the position of ``x`` in the iteration order.
+
+        This uses a table of counts of hook weighted vectors, rather
+        than iterating.
+
+        EXAMPLES::
+
+            sage: from ptdt_package import *
+            sage: HG = HillmanGrasslTableaux([3, 2], 6)
+            sage: [HG.rank(t) for t in HG] == list(range(HG.cardinality()))
+            True
+            sage: [HG.unrank(i) for i in range(HG.cardinality())] == HG.list()
+            True
+            sage: HG = HillmanGrasslTableaux([4, 3, 1], 300)
+            sage: HG.rank(HG.unrank(10^6))
+            1000000
+        """
+        hooks, order, counts = self._rank_table()
+        vec = [c for r in x for c in r]
+        rem = self._size
+        rank = Integer(0)
+        for k, j in enumerate(order):
+            # Vectors with a larger entry here come first
+            above = rem - (vec[j] + 1) * hooks[j]
+            if above >= 0:
+                rank += counts[k][above]
+            rem -= vec[j] * hooks[j]
+        return rank
+
+    def unrank(self, i):
+        """
+        Return the element at position ``i`` in the iteration order.
+        """
+        hooks, order, counts = self._rank_table()
+        if not 0 <= i < counts[0][self._size]:
+            raise ValueError("%s is out of range" % i)
+        vec = [Integer(0)] * len(hooks)
+        rem = self._size
+        for k, j in enumerate(order):
+            a = rem // hooks[j]
+            while i >= counts[k + 1][rem - a * hooks[j]]:
+                i -= counts[k + 1][rem - a * hooks[j]]
+                a -= 1
+            vec[j] = Integer(a)
+            rem -= a * hooks[j]
         return self._from_integer_vector(vec)
 
+    def random_element(self, q=None):
+        """
+        Return a uniformly random element, by a Boltzmann sampler.
+
+        The entries are independent geometric variables with parameter
+        q^hook, and samples of the wrong size are rejected.  By default
+        q is tuned so that the expected size is the size of this set.
+
+        EXAMPLES::
+
+            sage: from ptdt_package import *
+            sage: HG = HillmanGrasslTableaux([3, 2], 2000)
+            sage: HG.random_element() in HG
+            True
+            sage: HillmanGrasslTableaux([2, 1], 5).random_element(q=0.5).hg_size()
+            5
+            sage: HillmanGrasslTableaux([2, 1], 5).random_element(q=1)
+            Traceback (most recent call last):
+            ...
+            ValueError: q must be in (0, 1)
+        """
+        hooks = sum(self._shape.hook_lengths(), [])
+        return self._from_integer_vector(
+            _boltzmann_vector(hooks, self._size, q))
+
 class HillmanGrasslTableaux_all(HillmanGrasslTableaux,
                                 DisjointUnionEnumeratedSets):
     def __init__(self, shape):
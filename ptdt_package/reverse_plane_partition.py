@@ -190,8 +190,43 @@ class ReversePlanePartitions_size(ReversePlanePartitions):
     def cardinality(self):
         return self._hillman_grassl().cardinality()
 
-    def random_element(self):
-        hg = self._hillman_grassl().random_element()
+    def rank(self, x):
+        """
+        Return the position of ``x`` in the iteration order, which is
+        the rank of its Hillman-Grassl tableau.
+
+        EXAMPLES::
+
+            sage: from ptdt_package import *
+            sage: RPP = ReversePlanePartitions([2, 2, 1], 5)
+            sage: [RPP.unrank(i) for i in range(RPP.cardinality())] == RPP.list()
+            True
+            sage: all(RPP.rank(x) == i for i, x in enumerate(RPP))
+            True
+        """
+        hg = ReversePlanePartition(x).to_HillmanGrasslTableau()
+        return self._hillman_grassl().rank(hg)
+
+    def unrank(self, i):
+        """
+        Return the element at position ``i`` in the iteration order.
+        """
+        hg = self._hillman_grassl().unrank(i)
+        return self(hg.to_ReversePlanePartition())
+
+    def random_element(self, q=None):
+        """
+        Return a uniformly random element, from a Boltzmann sample of
+        Hillman-Grassl tableaux with parameter q.
+
+        EXAMPLES::
+
+            sage: from ptdt_package import *
+            sage: RPP = ReversePlanePartitions([2, 2, 1], 1000)
+            sage: RPP.random_element() in RPP
+            True
+        """
+        hg = self._hillman_grassl().random_element(q)
         return self(hg.to_ReversePlanePartition())
 
     def __contains__(self, x):
@@ -0,0 +1,284 @@
+# -*- mode: sage -*-
+"""
+The RSK correspondence on mutable rows.
+
+While inserting, a tableau is kept as a list of weakly increasing
+lists, so that finding the entry to bump is a binary search and
+nothing is copied or validated.  Tableaux are only built from the
+rows at the end.
+"""
+
+from bisect import bisect_left, bisect_right
+from heapq import heapify, heappop, heappush
+from math import floor, log
+from sage.combinat.plane_partition import PlanePartition
+from sage.misc.prandom import random
+
+def row_insert_rows(rows, k):
+    """
+    Row insert k into rows, in place.
+
+    INPUT:
+
+    - ``rows`` -- a list of weakly increasing lists, the rows of a
+      semistandard tableau
+
+    - ``k`` -- the entry to insert
+
+    OUTPUT:
+
+    The index of the row which grew by one cell.
+
+    EXAMPLES::
+
+        sage: from ptdt_package.rsk import row_insert_rows
+        sage: rows = [[1, 2, 2], [3]]
+        sage: row_insert_rows(rows, 1)
+        2
+        sage: rows
+        [[1, 1, 2], [2], [3]]
+    """
+    for row, r in enumerate(rows):
+        # the first entry strictly greater than k
+        col = bisect_right(r, k)
+        if col == len(r):
+            r.append(k)
+            return row
+        r[col], k = k, r[col]
+    rows.append([k])
+    return len(rows) - 1
+
+def rsk_rows(omega):
+    """
+    Apply the RSK algorithm to a two-line array.
+
+    INPUT:
+
+    - ``omega`` -- an iterable of pairs ``((i, j), a)``, meaning the
+      column ``(i, j)`` appears ``a`` times, sorted by ``i`` and then
+      by ``j``
+
+    OUTPUT:
+
+    A pair ``(P, Q)`` of the insertion and recording tableaux, as
+    lists of rows.
+
+    EXAMPLES::
+
+        sage: from ptdt_package.rsk import rsk_rows
+        sage: omega = [((1, 1), 1), ((1, 3), 2), ((2, 2), 2),
+        ....:          ((3, 1), 1), ((3, 2), 1)]
+        sage: rsk_rows(omega)
+        ([[1, 1, 2, 2], [2, 3], [3]], [[1, 1, 1, 3], [2, 2], [3]])
+    """
+    P = []
+    Q = []
+    for (i, j), a in omega:
+        for _ in range(a):
+            row = row_insert_rows(P, j)
+            if row < len(Q):
+                Q[row].append(i)
+            else:
+                Q.append([i])
+    return P, Q
+
+def inverse_row_insert_rows(rows, row):
+    """
+    Reverse a row insertion, in place.
+
+    The last entry of ``rows[row]`` is removed, and bumped back up
+    through the rows above it.
+
+    INPUT:
+
+    - ``rows`` -- a list of weakly increasing lists, the rows of a
+      semistandard tableau
+
+    - ``row`` -- the index of the row which grew in the insertion;
+      removing its last cell must leave a partition shape
+
+    OUTPUT:
+
+    The entry which was bumped out of the first row.
+
+    EXAMPLES::
+
+        sage: from ptdt_package.rsk import inverse_row_insert_rows
+        sage: rows = [[1, 1, 2], [2], [3]]
+        sage: inverse_row_insert_rows(rows, 2)
+        1
+        sage: rows
+        [[1, 2, 2], [3]]
+    """
+    k = rows[row].pop()
+    if not rows[row]:
+        rows.pop()
+    for r in reversed(rows[:row]):
+        # the last entry strictly less than k
+        col = bisect_left(r, k) - 1
+        r[col], k = k, r[col]
+    return k
+
+def inverse_rsk_rows(P, Q):
+    """
+    Apply the inverse RSK algorithm.
+
+    The cell to remove next is the largest, rightmost entry of ``Q``.
+    The ends of the rows of ``Q`` are kept in a heap, so finding it
+    does not scan all the rows.
+
+    INPUT:
+
+    - ``P``, ``Q`` -- the insertion and recording tableaux, of the
+      same shape, as tableaux or lists of rows.  They are not modified.
+
+    OUTPUT:
+
+    The two-line array as a dict, where ``(i, j)`` maps to the number
+    of times the column ``(i, j)`` appears.
+
+    EXAMPLES::
+
+        sage: from ptdt_package.rsk import rsk_rows, inverse_rsk_rows
+        sage: P = [[1, 1, 2, 2], [2, 3], [3]]
+        sage: Q = [[1, 1, 1, 3], [2, 2], [3]]
+        sage: omega = inverse_rsk_rows(P, Q)
+        sage: sorted(omega.items())
+        [((1, 1), 1), ((1, 3), 2), ((2, 2), 2), ((3, 1), 1), ((3, 2), 1)]
+        sage: rsk_rows(sorted(omega.items())) == (P, Q)
+        True
+    """
+    P = [list(r) for r in P]
+    Q = [list(r) for r in Q]
+    if [len(r) for r in P] != [len(r) for r in Q]:
+        raise ValueError("P and Q are not the same shape")
+    heap = [(-r[-1], -len(r), row) for row, r in enumerate(Q) if r]
+    heapify(heap)
+    omega = {}
+    while heap:
+        _, _, row = heappop(heap)
+        i = Q[row].pop()
+        j = inverse_row_insert_rows(P, row)
+        omega[i, j] = omega.get((i, j), 0) + 1
+        if Q[row]:
+            heappush(heap, (-Q[row][-1], -len(Q[row]), row))
+    return omega
+
+### Plane partitions from matrices, by the Dot method
+# See RSK_stuff/Dot_Method.txt.  Plane partitions are lists of rows
+# here, and partitions are weakly decreasing lists.
+
+def _conjugate(part):
+    return [sum(1 for x in part if x > j) for j in range(part[0])] if part else []
+
+def _columns(rows):
+    return [[r[c] for r in rows if len(r) > c]
+            for c in range(len(rows[0]))] if rows else []
+
+def _merge_columns(pcol, qcol):
+    """
+    Merge two columns of reverse SSYTs by identifying diagonals.
+    """
+    d = len(pcol)
+    pslant = [pcol[i] + i for i in range(d)]
+    qconj = _conjugate([qcol[i] + i for i in range(d)])
+    return pslant + qconj[d:]
+
+def _frobenius_upper(part):
+    rank = sum(1 for i, x in enumerate(part) if x > i)
+    return [part[i] - i for i in range(rank)]
+
+def matrix_to_plane_partition(mat):
+    """
+    Return the plane partition corresponding to a matrix.
+
+    The matrix goes to a pair of reverse SSYTs of the same shape by
+    RSK, which are merged into a plane partition by the Dot method.
+    A unit in entry ``(i, j)`` (counting from 0) contributes
+    ``i + j + 1`` to the size, and an ``a`` by ``b`` matrix gives a
+    plane partition with at most ``a`` rows and ``b`` columns.
+
+    INPUT:
+
+    - ``mat`` -- a matrix of nonnegative integers, or a dict mapping
+      ``(i, j)`` to its nonzero entries
+
+    EXAMPLES::
+
+        sage: from ptdt_package import *
+        sage: matrix_to_plane_partition(matrix(ZZ, 2, 2, [1, 0, 0, 1]))
+        Plane partition [[2, 1], [1]]
+        sage: plane_partition_to_matrix(_)
+        {(0, 0): 1, (1, 1): 1}
+        sage: A = random_matrix(ZZ, 4, 5, x=0, y=3)
+        sage: pp = matrix_to_plane_partition(A)
+        sage: sum(sum(r) for r in pp) == sum(a * (i + j + 1) for (i, j), a in A.dict().items())
+        True
+        sage: plane_partition_to_matrix(pp) == A.dict()
+        True
+    """
+    entries = mat.dict() if hasattr(mat, 'dict') else mat
+    omega = [((i + 1, j + 1), a) for (i, j), a in entries.items() if a]
+    if not omega:
+        return PlanePartition([])
+    # Use RSK on the reversed indices, to get reverse SSYTs
+    M = max(max(i, j) + 1 for (i, j), a in omega)
+    omega = sorted(((M - i, M - j), a) for (i, j), a in omega)
+    P, Q = rsk_rows(omega)
+    P = [[M - x for x in r] for r in P]
+    Q = [[M - x for x in r] for r in Q]
+    cols = [_merge_columns(pcol, qcol)
+            for pcol, qcol in zip(_columns(P), _columns(Q))]
+    rows = _columns(cols)
+    return PlanePartition([_conjugate(r) for r in rows])
+
+def plane_partition_to_matrix(pp):
+    """
+    Return the matrix corresponding to a plane partition, as a dict
+    mapping ``(i, j)`` to its nonzero entries.
+
+    This is the inverse of :func:`matrix_to_plane_partition`.
+    """
+    rows = [[x for x in r if x] for r in pp]
+    rows = [r for r in rows if r]
+    if not rows:
+        return {}
+    cols = _columns([_conjugate(r) for r in rows])
+    P = _columns([_frobenius_upper(c) for c in cols])
+    Q = _columns([_frobenius_upper(_conjugate(c)) for c in cols])
+    M = max(x for T in (P, Q) for r in T for x in r) + 1
+    omega = inverse_rsk_rows([[M - x for x in r] for r in P],
+                             [[M - x for x in r] for r in Q])
+    return {(M - i - 1, M - j - 1): a for (i, j), a in omega.items()}
+
+def random_plane_partition(q, nrows, ncols):
+    """
+    Return a random plane partition with at most ``nrows`` rows and
+    ``ncols`` columns, where ``pi`` has probability proportional to
+    ``q^|pi|``.
+
+    The matrix entries are drawn independently, with entry ``(i, j)``
+    geometric with parameter ``q^(i + j + 1)``, and sent to a plane
+    partition by :func:`matrix_to_plane_partition`.  This takes time
+    nearly linear in the size of the result.
+
+    EXAMPLES::
+
+        sage: from ptdt_package import random_plane_partition
+        sage: pp = random_plane_partition(0.9, 10, 10)
+        sage: len(pp) <= 10
+        True
+    """
+    if not 0 <= q < 1:
+        raise ValueError("q must be in [0, 1)")
+    entries = {}
+    for i in range(nrows):
+        for j in range(ncols):
+            x = float(q) ** (i + j + 1)
+            if x == 0:
+                continue
+            # Inverse transform sampling, 1 - random() is in (0, 1]
+            a = int(floor(log(1 - random()) / log(x)))
+            if a:
+                entries[i, j] = a
+    return matrix_to_plane_partition(entries)
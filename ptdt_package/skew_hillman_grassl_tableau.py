@@ -16,7 +16,7 @@ from sage.categories.infinite_enumerated_sets import \
 from sage.categories.finite_enumerated_sets import FiniteEnumeratedSets
 from sage.categories.sets_with_grading import SetsWithGrading
 from sage.structure.parent import Parent
-from hillman_grassl_tableau import HillmanGrasslTableau
+from hillman_grassl_tableau import HillmanGrasslTableau, _boltzmann_vector
 
 class SkewHillmanGrasslTableau(SkewTableau):
     r"""
@@ -232,9 +232,18 @@ class SkewHillmanGrasslTableaux_size(SkewHillmanGrasslTableaux):
     def cardinality(self):
         return self._weighted_integer_vectors().cardinality()
 
-    def random_element(self):
-        vec = self._weighted_integer_vectors().random_element()
-        return self._from_integer_vector(vec)
+    def random_element(self, q=None):
+        """
+        Return a uniformly random element, by a Boltzmann sampler.
+
+        Only cells with hook at most the size can be nonzero, so these
+        are the only entries which are sampled.  See
+        :meth:`HillmanGrasslTableaux_size.random_element`.
+        """
+        hooks = self._hook_tableu()
+        weights = [h for r in hooks for h in r if h]
+        return self._from_integer_vector(
+            _boltzmann_vector(weights, self._size, q))
 
 class SkewHillmanGrasslTableaux_all(SkewHillmanGrasslTableaux,
                                     DisjointUnionEnumeratedSets):
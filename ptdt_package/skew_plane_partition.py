@@ -176,8 +176,20 @@ class SkewPlanePartitions_size(SkewPlanePartitions):
     def cardinality(self):
         return self._reverse_plane_partitions().cardinality()
 
-    def random_element(self):
-        rpp = self._reverse_plane_partitions().random_element()
+    def random_element(self, q=None):
+        """
+        Return a uniformly random element, from a random reverse plane
+        partition of the bounding shape.  See
+        :meth:`ReversePlanePartitions_size.random_element`.
+
+        EXAMPLES::
+
+            sage: from ptdt_package import *
+            sage: SPP = SkewPlanePartitions([2, 1], 30)
+            sage: SPP.random_element() in SPP
+            True
+        """
+        rpp = self._reverse_plane_partitions().random_element(q)
         return self(rpp.to_SkewPlanePartition())
 
     def __contains__(self, x):
@@ -11,6 +11,8 @@ from sage.combinat.partition import Partition
 from sage.combinat.skew_tableau import SkewTableau
 from sage.structure.element import parent
 from sage.rings.all import ZZ, Integer, O
+from sage.rings.polynomial.polynomial_ring_constructor import PolynomialRing
+from sage.arith.all import binomial
 from sage.misc.all import prod
 from .reverse_plane_partition import *
 from .skew_plane_partition import *
@@ -44,6 +46,88 @@ def partition_weight(coefficients, powers, partition, invert=False):
                    for i, j in partition.cells()
                    for k in range(partition[i][j]))
 
+# Coefficients of the Eulerian polynomials A_0, A_1, ..., computed so far
+_eulerian_coefficients = [[Integer(1)]]
+
+def eulerian_polynomial(n, q=None):
+    """Return the Eulerian polynomial A_n(q).
+
+    These satisfy sum_k k^n q^k = q A_n(q) / (1 - q)^(n + 1).  The
+    coefficients are computed iteratively from the recurrence
+    A(n, k) = (k + 1) A(n - 1, k) + (n - k) A(n - 1, k - 1), and
+    remembered for later calls.  If q is given, the polynomial is
+    evaluated at q.
+
+    EXAMPLES::
+        sage: from ptdt_package import eulerian_polynomial
+        sage: eulerian_polynomial(4)
+        q^3 + 11*q^2 + 11*q + 1
+        sage: R.<t> = QQ[]
+        sage: eulerian_polynomial(3, t)
+        t^2 + 4*t + 1
+    """
+    n = Integer(n)
+    if n < 0:
+        raise ValueError("n must be a natural number")
+    cache = _eulerian_coefficients
+    while len(cache) <= n:
+        m = len(cache)
+        prev = cache[-1] + [0]
+        cache.append([(k + 1) * prev[k] + (m - k) * (prev[k - 1] if k else 0)
+                      for k in range(m)])
+    coefficients = cache[n]
+    if q is None:
+        return PolynomialRing(ZZ, 'q')(coefficients)
+    return sum(coeff * q ** k for k, coeff in enumerate(coefficients))
+
+def _box_powers(powers):
+    """Return ('power', n) if powers is an integer n >= 0, ('ones', n)
+    if it is the tuple (1,)*n, and None otherwise.
+    """
+    try:
+        n = Integer(powers)
+        return ('power', n) if n >= 0 else None
+    except TypeError:
+        powers = tuple(powers)
+    if all(m == 1 for m in powers):
+        return 'ones', len(powers)
+    return None
+
+def pt_box_series(coefficients, powers, prec=6):
+    """Calculate weighted_sum(coefficients, powers, [1], 'pt', prec)
+    from its closed form, without enumerating partitions.
+
+    If powers is an integer n, this is c^n q A_n(q) / (q - 1)^(n + 2),
+    where A_n is the Eulerian polynomial.  If powers is the tuple
+    (1,)*n, the coefficient of q^v is (c v (v - 1) / 2)^n.
+
+    EXAMPLES::
+        sage: from ptdt_package import *
+        sage: from ptdt_package.weights import partition_weight
+        sage: R.<a,b> = ZZ[]
+        sage: c = -a - b
+        sage: S.<q> = R[[]]
+        sage: for powers in [0, 1, 4, (), (1, 1, 1)]:
+        ....:     Z = sum(partition_weight((a, b, c), powers, pi, True) * q^n
+        ....:             for n in range(8)
+        ....:             for pi in ReversePlanePartitions([1], n)) + O(q^8)
+        ....:     assert pt_box_series((a, b, c), powers, 8) == Z
+        sage: pt_box_series((a, b, c), 1, 4)
+        (a + b)*q + (3*a + 3*b)*q^2 + (6*a + 6*b)*q^3 + O(q^4)
+    """
+    kind, n = _box_powers(powers)
+    c = coefficients[2]
+    base_ring = parent(sum(coefficients))
+    R = base_ring[['q']]
+    q = R.gen()
+    if kind == 'ones':
+        return sum((c * (v * (v - 1) // 2)) ** n * q ** v
+                   for v in range(prec)) + O(q ** prec)
+    # 1 / (1 - q)^(n + 2), up to the required precision
+    inverse = R([binomial(v + n + 1, n + 1) for v in range(prec)], prec)
+    return ((-c) ** n * q * eulerian_polynomial(n, q) * inverse
+            + O(q ** prec))
+
 def weighted_sum(coefficients, powers, shape, domain='pt', prec=6):
     """Calculate the weighted sum over weight*q^size
     EXAMPLES::
@@ -57,6 +141,9 @@ def weighted_sum(coefficients, powers, shape, domain='pt', prec=6):
         sage: weighted_sum((a,b,c), 1, [2, 1], prec=3)
         (a + b - 2*c)*q + (3*a + 3*b - 8*c)*q^2 + O(q^3)
     """
+    if (domain == 'pt' and tuple(shape) == (1,)
+            and _box_powers(powers) is not None):
+        return pt_box_series(coefficients, powers, prec)
     if domain == 'pt':
         P = ReversePlanePartitions(shape)
         invert = True
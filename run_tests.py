@@ -12,5 +12,6 @@ import sys
 sys.path.insert(0, os.path.dirname(os.path.realpath(__file__)))
 
 DD = DocTestDefaults()
-DC = DocTestController(DD, ['ptdt_package', 'chern_char.sage'])
+DC = DocTestController(DD, ['ptdt_package', 'chern_char.sage', 'pt_triple.sage',
+                            'PT_DT_stuff'])
 DC.run()
@@ -69,6 +69,7 @@ For display options, see :meth:`Tableaux.options`.
 from __future__ import print_function, absolute_import
 from six.moves import range, zip
 from six import add_metaclass
+import itertools
 
 from sage.sets.disjoint_union_enumerated_sets import DisjointUnionEnumeratedSets
 from sage.sets.family import Family
@@ -5439,13 +5440,14 @@ class SemistandardTableaux(Tableaux):
                 raise ValueError( 'infinite set' )
         else:
             raise ValueError( 'r must be an integer or a slice' )
-        count=0
+        if stop is not None and start >= stop:
+            return []
+        count=start
         tabs=[]
-        for t in self:
+        for t in self._iter_from(start):
             if count==stop:
                 break
-            if count>=start:
-                tabs.append(t)
+            tabs.append(t)
             count+=1
 
         # this is to cope with empty slices endpoints like [:6] or [:}
@@ -5453,6 +5455,21 @@ class SemistandardTableaux(Tableaux):
             return tabs
         raise IndexError('value out of range')
 
+    def _iter_from(self, start):
+        """
+        Iterate over ``self``, starting with the element of rank
+        ``start``.
+
+        Parents which can unrank quickly override this, so that slices
+        do not iterate over all the earlier elements.
+
+        EXAMPLES::
+
+            sage: list(SemistandardTableaux(3, max_entry=2)._iter_from(4))
+            [[[1, 1], [2]], [[1, 2], [2]]]
+        """
+        return itertools.islice(self, start, None)
+
     def __contains__(self, t):
         """
         Return ``True`` if ``t`` can be interpreted as a
@@ -5946,6 +5963,69 @@ class SemistandardTableaux_size(SemistandardTableaux):
             for sst in SemistandardTableaux_shape(part, self.max_entry):
                 yield self.element_class(self, sst)
 
+def _gelfand_tsetlin_candidates(shape, prev, r):
+    r"""
+    Return the possible shapes `\mu` of the entries at most `k` of a
+    semistandard tableau of shape ``shape``, given the shape ``prev``
+    of its entries at most `k-1`, when there are ``r`` larger entries
+    left to place.
+
+    These are the partitions `\mu` inside ``shape`` such that
+    `\mu / prev` is a horizontal strip, and the columns of
+    ``shape`` `/ \mu` have length at most ``r``.  They are listed
+    with larger partitions first, and in reverse lexicographic order
+    among partitions of the same size.
+
+    EXAMPLES::
+
+        sage: from sage.combinat.tableau import _gelfand_tsetlin_candidates
+        sage: _gelfand_tsetlin_candidates((3, 2), (2,), 1)
+        [(3, 2), (3, 1), (2, 2), (3,), (2, 1), (2,)]
+        sage: _gelfand_tsetlin_candidates((2, 2, 2), (), 1)
+        []
+    """
+    if len(shape) > len(prev) + 1 + r:
+        return []
+    ranges = []
+    for i in range(min(len(prev) + 1, len(shape))):
+        low = prev[i] if i < len(prev) else 0
+        if i + r < len(shape):
+            low = max(low, shape[i + r])
+        high = min(shape[i], prev[i-1]) if i > 0 else shape[0]
+        if low > high:
+            return []
+        ranges.append(range(high, low - 1, -1))
+    candidates = [tuple(x for x in mu if x)
+                  for mu in itertools.product(*ranges)]
+    # itertools.product is in reverse lexicographic order already
+    candidates.sort(key=sum, reverse=True)
+    return candidates
+
+def _skew_semistandard_count(shape, mu, r):
+    r"""
+    Return the number of semistandard tableaux of skew shape
+    ``shape`` `/` ``mu`` with entries in `\{1, \ldots, r\}`.
+
+    This is the Jacobi-Trudi determinant for `s_{\lambda/\mu}(1^r)`,
+    with `h_d(1^r) = \binom{r+d-1}{d}`.
+
+    EXAMPLES::
+
+        sage: from sage.combinat.tableau import _skew_semistandard_count
+        sage: _skew_semistandard_count((2, 1), (), 3)
+        8
+        sage: _skew_semistandard_count((3, 2), (2,), 2)
+        6
+    """
+    if r == 0:
+        return Integer(1) if tuple(mu) == tuple(shape) else Integer(0)
+    from sage.matrix.constructor import matrix
+    from sage.rings.all import ZZ
+    l = len(shape)
+    mu = list(mu) + [0] * (l - len(mu))
+    h = lambda d: binomial(r + d - 1, d) if d >= 0 else 0
+    return matrix(ZZ, l, l, lambda i, j: h(shape[i] - mu[j] - i + j)).det()
+
 class SemistandardTableaux_shape(SemistandardTableaux):
     """
     Semistandard tableaux of fixed shape `p` with a given max entry.
@@ -5985,10 +6065,16 @@ class SemistandardTableaux_shape(SemistandardTableaux):
         self.shape = p
 
     def __iter__(self):
-        """
+        r"""
         An iterator for the semistandard tableaux of the specified shape
         with the specified max entry.
 
+        A tableau is determined by the shapes `\lambda^{(k)}` of its
+        entries at most `k`, for `k = 1, \ldots, n-1` where `n` is the
+        max entry.  The tableaux are ordered by `\lambda^{(1)}`, then by
+        `\lambda^{(2)}`, and so on, where larger shapes come first, and
+        shapes of the same size are in reverse lexicographic order.
+
         EXAMPLES::
 
             sage: [ t for t in SemistandardTableaux([3]) ]
@@ -6024,10 +6110,195 @@ class SemistandardTableaux_shape(SemistandardTableaux):
             sage: sst[0].parent() is sst
             True
         """
-        for c in integer_vectors_nk_fast_iter(sum(self.shape), self.max_entry):
-            for sst in SemistandardTableaux_shape_weight(self.shape, Composition(c)):
-                yield self.element_class(self, sst)
+        return self._gelfand_tsetlin_iter()
+
+    def _chain(self, t):
+        r"""
+        Return the shapes of the entries of ``t`` at most `1, 2, \ldots`,
+        up to one less than the max entry, as tuples.
+
+        EXAMPLES::
+
+            sage: SemistandardTableaux([3,1], max_entry=3)._chain([[1,1,3],[2]])
+            [(2,), (2, 1)]
+        """
+        return [tuple(x for x in (sum(1 for v in row if v <= k) for row in t)
+                      if x)
+                for k in range(1, self.max_entry)]
+
+    def _from_chain(self, chain):
+        r"""
+        Return the tableau whose entries at most `k` have the shape
+        ``chain[k-1]``.
+
+        EXAMPLES::
+
+            sage: SemistandardTableaux([3,1], max_entry=3)._from_chain([(2,), (2, 1)])
+            [[1, 1, 3], [2]]
+        """
+        shapes = [()] + list(chain) + [tuple(self.shape)]
+        tableau = [[None] * l for l in self.shape]
+        for k in range(1, len(shapes)):
+            prev, mu = shapes[k-1], shapes[k]
+            for i, l in enumerate(mu):
+                for j in range(prev[i] if i < len(prev) else 0, l):
+                    tableau[i][j] = k
+        return self.element_class(self, tableau)
+
+    def _gelfand_tsetlin_iter(self, chain=None):
+        r"""
+        Iterate over ``self`` by walking the Gelfand-Tsetlin patterns,
+        that is the chains of shapes of the entries at most
+        `1, 2, \ldots`, depth first.  Start from the tableau with the
+        given ``chain``, or from the first tableau if it is ``None``.
+
+        One tableau is kept and updated in place: changing the shape of
+        the entries at most `k` only rewrites the cells between it and
+        the shape of the entries at most `k-1`.  The lists of candidate
+        shapes are cached, since they only depend on the previous shape.
+
+        EXAMPLES::
+
+            sage: SST = SemistandardTableaux([2,1], max_entry=3)
+            sage: list(SST._gelfand_tsetlin_iter([(1,), (1, 1)]))
+            [[[1, 3], [2]], [[1, 3], [3]], [[2, 2], [3]], [[2, 3], [3]]]
+        """
+        shape = tuple(self.shape)
+        n = self.max_entry
+        if len(shape) > n:
+            return
+        if n == 0:
+            yield self.element_class(self, [])
+            return
+
+        tableau = [[n] * l for l in shape]
+        # shapes[k] is the shape of the entries at most k, and
+        # position[k] is the index of the next candidate for it
+        shapes = [()] * n
+        position = [0] * n
+        cache = {}
+
+        def candidates(k):
+            key = (shapes[k-1], k)
+            if key not in cache:
+                cache[key] = _gelfand_tsetlin_candidates(shape, shapes[k-1], n - k)
+            return cache[key]
+
+        def place(k, mu):
+            prev = shapes[k-1]
+            for i, l in enumerate(mu):
+                row = tableau[i]
+                for j in range(prev[i] if i < len(prev) else 0, l):
+                    row[j] = k
+            shapes[k] = mu
+
+        if chain is None:
+            k = 1
+        else:
+            for k, mu in enumerate(chain, 1):
+                position[k] = candidates(k).index(mu) + 1
+                place(k, mu)
+            k = n
+
+        while k > 0:
+            if k == n:
+                # the rest of the cells are n
+                prev = shapes[n-1]
+                for i, l in enumerate(shape):
+                    row = tableau[i]
+                    for j in range(prev[i] if i < len(prev) else 0, l):
+                        row[j] = n
+                # the element copies the rows
+                yield self.element_class(self, tableau)
+                k -= 1
+            elif position[k] < len(candidates(k)):
+                mu = candidates(k)[position[k]]
+                position[k] += 1
+                place(k, mu)
+                k += 1
+                if k < n:
+                    position[k] = 0
+            else:
+                k -= 1
+
+    def rank(self, t):
+        r"""
+        Return the position of ``t`` in the iteration order of ``self``.
+
+        This sums the numbers of tableaux with each earlier choice of
+        the shapes of the entries at most `1, 2, \ldots`, which are
+        skew semistandard tableaux counted by determinants, so it does
+        not iterate over ``self``.
+
+        EXAMPLES::
+
+            sage: SST = SemistandardTableaux([2,1], max_entry=3)
+            sage: [SST.rank(t) for t in SST]
+            [0, 1, 2, 3, 4, 5, 6, 7]
+            sage: SST = SemistandardTableaux([4,3,2,1], max_entry=8)
+            sage: SST.rank(SST.unrank(123456))
+            123456
+        """
+        if t not in self:
+            raise ValueError("%s is not an element of %s" % (t, self))
+        shape = tuple(self.shape)
+        n = self.max_entry
+        r = 0
+        prev = ()
+        for k, mu in enumerate(self._chain(t), 1):
+            for nu in _gelfand_tsetlin_candidates(shape, prev, n - k):
+                if nu == mu:
+                    break
+                r += _skew_semistandard_count(shape, nu, n - k)
+            prev = mu
+        return Integer(r)
+
+    def unrank(self, r):
+        """
+        Return the tableau of rank ``r`` in the iteration order of
+        ``self``, without iterating over ``self``.
+
+        EXAMPLES::
+
+            sage: SST = SemistandardTableaux([2,1], max_entry=3)
+            sage: [SST.unrank(i) for i in range(8)] == SST.list()
+            True
+            sage: SemistandardTableaux([4,3,2,1], max_entry=8).unrank(10^5)
+            [[1, 2, 4, 4], [3, 7, 8], [6, 8], [7]]
+        """
+        N = self.cardinality()
+        if r < 0 or r >= N:
+            raise ValueError("the value must be between 0 and %s inclusive" % (N - 1))
+        shape = tuple(self.shape)
+        n = self.max_entry
+        chain = []
+        prev = ()
+        for k in range(1, n):
+            for mu in _gelfand_tsetlin_candidates(shape, prev, n - k):
+                c = _skew_semistandard_count(shape, mu, n - k)
+                if r < c:
+                    break
+                r -= c
+            chain.append(mu)
+            prev = mu
+        return self._from_chain(chain)
 
+    def _iter_from(self, start):
+        """
+        Iterate over ``self`` starting from the tableau of rank
+        ``start``, by unranking it and then walking on from its
+        Gelfand-Tsetlin pattern.
+
+        EXAMPLES::
+
+            sage: SemistandardTableaux([3,2,1], max_entry=4)[60:62]
+            [[[2, 2, 4], [3, 3], [4]], [[2, 2, 4], [3, 4], [4]]]
+        """
+        if start >= self.cardinality():
+            return
+        chain = self._chain(self.unrank(start))
+        for t in self._gelfand_tsetlin_iter(chain):
+            yield t
 
     def __contains__(self, x):
         """
@@ -6268,6 +6539,36 @@ class SemistandardTableaux_shape_weight(SemistandardTableaux_shape):
         for t in symmetrica.kostka_tab(self.shape, self.weight):
             yield self.element_class(self, t)
 
+    # The ranking of SemistandardTableaux_shape is for its own order,
+    # not the one from symmetrica, so use the generic methods
+    def rank(self, x):
+        """
+        EXAMPLES::
+
+            sage: SST = SemistandardTableaux([3,1],[2,1,1])
+            sage: SST.rank([[1, 1, 3], [2]])
+            1
+        """
+        return super(SemistandardTableaux_shape, self).rank(x)
+
+    def unrank(self, r):
+        """
+        EXAMPLES::
+
+            sage: SemistandardTableaux([3,1],[2,1,1]).unrank(1)
+            [[1, 1, 3], [2]]
+        """
+        return super(SemistandardTableaux_shape, self).unrank(r)
+
+    def _iter_from(self, start):
+        """
+        EXAMPLES::
+
+            sage: list(SemistandardTableaux([3,1],[2,1,1])._iter_from(1))
+            [[[1, 1, 3], [2]]]
+        """
+        return super(SemistandardTableaux_shape, self)._iter_from(start)
+
 
     def list(self):
         """
@@ -6762,6 +7063,43 @@ class StandardTableaux_size(StandardTableaux):
         return from_cycles(self.size, permutation_cycle_rep).robinson_schensted()[0]
 
 
+def _standard_count(mu, cache):
+    """
+    Return the number of standard tableaux of shape ``mu``, a tuple,
+    by the hook length formula.  The counts are memoized in the dict
+    ``cache``.
+
+    EXAMPLES::
+
+        sage: from sage.combinat.tableau import _standard_count
+        sage: _standard_count((3, 2, 1), {})
+        16
+    """
+    if mu not in cache:
+        hooks = 1
+        for i, l in enumerate(mu):
+            for j in range(l):
+                leg = sum(1 for m in mu[i+1:] if m > j)
+                hooks *= l - j + leg
+        cache[mu] = Integer(factorial(sum(mu)) // hooks)
+    return cache[mu]
+
+def _remove_corners(mu):
+    """
+    Iterate over the pairs ``(row, nu)``, where ``nu`` is ``mu`` with
+    the cell at the end of ``row`` removed, for every removable cell
+    from top to bottom.
+
+    EXAMPLES::
+
+        sage: from sage.combinat.tableau import _remove_corners
+        sage: list(_remove_corners((3, 1, 1)))
+        [(0, (2, 1, 1)), (2, (3, 1))]
+    """
+    for i, l in enumerate(mu):
+        if i + 1 == len(mu) or l > mu[i+1]:
+            yield i, mu[:i] + (l - 1,) * (l > 1) + mu[i+1:]
+
 class StandardTableaux_shape(StandardTableaux):
     """
     Semistandard tableaux of a fixed shape `p`.
@@ -6894,25 +7232,90 @@ class StandardTableaux_shape(StandardTableaux):
             sage: st[0].parent() is st
             True
         """
+        return self._iter_from(0)
+
+    def rank(self, t):
+        r"""
+        Return the position of ``t`` in the iteration order of ``self``.
+
+        The tableaux are listed in lexicographic order of the rows
+        containing `n, n-1, \ldots, 1`, so the rank is a sum of numbers
+        of standard tableaux of smaller shapes, from the hook length
+        formula.
+
+        EXAMPLES::
+
+            sage: ST = StandardTableaux([3,2])
+            sage: [ST.rank(t) for t in ST]
+            [0, 1, 2, 3, 4]
+            sage: ST = StandardTableaux([6,5,4,3])
+            sage: ST.rank(ST.unrank(10^6))
+            1000000
+        """
+        if t not in self:
+            raise ValueError("%s is not an element of %s" % (t, self))
+        rows = {}
+        for i, row in enumerate(t):
+            for x in row:
+                rows[x] = i
+        cache = {}
+        mu = tuple(self.shape)
+        r = 0
+        for k in range(sum(mu), 0, -1):
+            for row, nu in _remove_corners(mu):
+                if row == rows[k]:
+                    break
+                r += _standard_count(nu, cache)
+            mu = nu
+        return Integer(r)
+
+    def unrank(self, r):
+        """
+        Return the tableau of rank ``r`` in the iteration order of
+        ``self``, without iterating over ``self``.
 
+        EXAMPLES::
+
+            sage: ST = StandardTableaux([3,2])
+            sage: [ST.unrank(i) for i in range(5)] == ST.list()
+            True
+            sage: StandardTableaux([6,5,4,3]).unrank(10^6)
+            [[1, 2, 5, 8, 10, 13], [3, 4, 7, 12, 18], [6, 9, 15, 17], [11, 14, 16]]
+        """
+        N = self.cardinality()
+        if r < 0 or r >= N:
+            raise ValueError("the value must be between 0 and %s inclusive" % (N - 1))
+        cache = {}
+        mu = tuple(self.shape)
+        tableau = [[None]*l for l in mu]
+        for k in range(sum(mu), 0, -1):
+            for row, nu in _remove_corners(mu):
+                c = _standard_count(nu, cache)
+                if r < c:
+                    break
+                r -= c
+            tableau[row][mu[row]-1] = k
+            mu = nu
+        return self.element_class(self, tableau)
+
+    def _iter_from(self, start):
+        """
+        Iterate over ``self`` starting from the tableau of rank
+        ``start``, by unranking it and then stepping to the next
+        tableau.
+
+        EXAMPLES::
+
+            sage: StandardTableaux([6,5,4,3])[10^6:10^6+2]
+            [[[1, 2, 5, 8, 10, 13], [3, 4, 7, 12, 18], [6, 9, 15, 17], [11, 14, 16]],
+             [[1, 3, 4, 8, 10, 13], [2, 5, 7, 12, 18], [6, 9, 15, 17], [11, 14, 16]]]
+        """
+        if start >= self.cardinality():
+            return
         pi = self.shape
-        #Set the initial tableau by filling it in going down the columns
-        tableau = [[None]*n for n in pi]
+        tableau = self.unrank(start)
         size = sum(pi)
-        row = 0
-        col = 0
-        for i in range(size):
-            tableau[row][col] = i+1
-
-            #If we can move down, then do it;
-            #otherwise, move to the next column over
-            if ( row + 1 < len(pi) and col < pi[row+1]):
-                row += 1
-            else:
-                row = 0
-                col += 1
-
-        yield self.element_class(self, tableau)
+        yield tableau
 
         # iterate until we reach the last tableau which is
         # filled with the row indices.